@@ -21,14 +21,20 @@ To run: python pdf_editor_refactor.py
 """
 
 import os
+import re
 import sys
 import threading
 import queue
 import traceback
+import itertools
+import tempfile
+import shutil
 import subprocess
 import time
-from dataclasses import dataclass
-from typing import Optional, Tuple, List
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional, Tuple, List, Dict
 
 import tkinter as tk
 from tkinter import filedialog, messagebox
@@ -39,6 +45,31 @@ import pyttsx3
 
 # ----------------------------- Utilities ---------------------------------
 
+# whitespace following sentence-ending punctuation
+_SENT_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split text into non-empty sentence chunks for incremental TTS."""
+    return [c for c in _SENT_RE.split(text) if c.strip()]
+
+
+def _decode_resize(path: str, width: int, height: int) -> Tuple[str, bytes]:
+    """Decode an image file and resize it to (width, height).
+
+    Runs on a worker thread, so it returns the mode and raw pixel bytes rather
+    than a Tk image (Tk objects may only be created on the main thread).
+    """
+    img = Image.open(path)
+    # lets libjpeg decode at a reduced scale; a no-op for other formats
+    img.draft("RGB", (width, height))
+    img = img.convert("RGBA" if "A" in img.getbands() or "transparency" in img.info else "RGB")
+    # on-screen preview only (the saved PDF embeds the original file), so a
+    # box reduce followed by bilinear is plenty
+    img = img.resize((width, height), Image.BILINEAR, reducing_gap=2.0)
+    return img.mode, img.tobytes()
+
+
 def ensure_packages_installed():
     """Non-blocking check for required packages; prints instructions if missing."""
     missing = []
@@ -66,20 +97,65 @@ def ensure_packages_installed():
 class TTSWorker(threading.Thread):
     """Background worker that owns a single pyttsx3 engine instance.
 
-    It reads messages from a queue and speaks them. A stop_event is used to
-    request immediate termination; a sentinel None will also stop the loop.
+    It reads (priority, seq, cmd, payload) messages from a priority queue:
+    "say" speaks payload, "flush" drops everything queued before it, and
+    "stop" ends the loop. Control messages jump ahead of pending speech. A
+    stop_event is also used to request immediate termination.
+
+    The engine is only ever touched from this thread: flush() just raises
+    flush_event, and an engine callback stops the running utterance from
+    inside runAndWait().
     """
 
-    def __init__(self, text_queue: queue.Queue, stop_event: threading.Event):
+    URGENT = 0
+    NORMAL = 1
+    # max queued sentences handed to the engine per runAndWait()
+    BATCH_SIZE = 8
+
+    def __init__(self, text_queue: queue.PriorityQueue, stop_event: threading.Event):
         super().__init__(daemon=True)
         self.queue = text_queue
         self.stop_event = stop_event
         self.engine = None
+        self.flush_event = threading.Event()
+        # tie-breaker keeping FIFO order within a priority
+        self._seq = itertools.count()
+
+    def _put(self, priority: int, cmd: str, payload=None):
+        self.queue.put((priority, next(self._seq), cmd, payload))
+
+    def say(self, text: str):
+        self._put(self.NORMAL, "say", text)
+
+    def flush(self):
+        """Drop queued speech and interrupt the current utterance."""
+        self.flush_event.set()
+        self._put(self.URGENT, "flush")
+
+    def _on_engine_progress(self, name=None, *args, **kwargs):
+        # engine callback, runs on this thread inside runAndWait()
+        if self.flush_event.is_set():
+            self.engine.stop()
+
+    def _drain(self, before_seq: int):
+        # discard messages queued before the flush; keep anything newer
+        keep = []
+        while True:
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if item[1] > before_seq or item[2] == "stop":
+                keep.append(item)
+        for item in keep:
+            self.queue.put(item)
 
     def run(self):
         try:
             self.engine = pyttsx3.init()
             self.engine.setProperty("rate", 150)
+            self.engine.connect("started-utterance", self._on_engine_progress)
+            self.engine.connect("started-word", self._on_engine_progress)
         except Exception as e:
             print("TTS initialization failed:", e)
             return
@@ -87,17 +163,34 @@ class TTSWorker(threading.Thread):
         print("TTS worker started")
         while not self.stop_event.is_set():
             try:
-                text = self.queue.get(timeout=0.2)
+                _, seq, cmd, text = self.queue.get(timeout=0.2)
             except queue.Empty:
                 continue
 
-            if text is None:
-                # sentinel to stop immediately
+            if cmd == "stop":
                 break
+            if cmd == "flush":
+                self.flush_event.clear()
+                self._drain(seq)
+                continue
+
+            batch = [text]
+            while len(batch) < self.BATCH_SIZE:
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item[2] != "say":
+                    # control message: leave it for the next loop iteration
+                    self.queue.put(item)
+                    break
+                batch.append(item[3])
 
             try:
-                # engine.say + runAndWait is blocking — ok inside worker thread
-                self.engine.say(text)
+                # queue every sentence before one blocking runAndWait so the
+                # driver plays them back-to-back — ok inside worker thread
+                for chunk in batch:
+                    self.engine.say(chunk)
                 self.engine.runAndWait()
             except Exception as e:
                 print("TTS speak error:", e)
@@ -113,9 +206,9 @@ class TTSWorker(threading.Thread):
 
     def stop(self):
         self.stop_event.set()
-        # push sentinel to unblock queue
+        # push a stop message to unblock queue
         try:
-            self.queue.put_nowait(None)
+            self._put(self.URGENT, "stop")
         except Exception:
             pass
 
@@ -127,11 +220,38 @@ class ImageModification:
     page_num: int
     old_rect: fitz.Rect
     new_image_path: str
+    # old_rect in canvas pixels, valid while canvas_zoom matches the current zoom
+    canvas_rect: Optional[Tuple[int, int, int, int]] = field(default=None, compare=False, repr=False)
+    canvas_zoom: float = field(default=0.0, compare=False, repr=False)
+
+
+# modifications are keyed by (page_num, old_rect as a tuple): one edit per image slot
+ModKey = Tuple[int, Tuple[float, float, float, float]]
+
+
+def _mod_key(mod: ImageModification) -> ModKey:
+    r = mod.old_rect
+    return (mod.page_num, (r.x0, r.y0, r.x1, r.y1))
+
+
+# hit-test grid entry: (bbox, bbox grown by the click buffer, bbox in canvas pixels)
+HitEntry = Tuple[fitz.Rect, fitz.Rect, Tuple[int, int, int, int]]
 
 
 # ----------------------------- Main App ----------------------------------
 
 class PDFEditorApp:
+    # number of rendered base pages kept around for fast navigation
+    PAGE_CACHE_SIZE = 16
+    # byte budget for pixmaps prefetched but not yet displayed
+    PREFETCH_CACHE_BYTES = 32 * 1024 * 1024
+    # cell size, in PDF points, of the grid used for click hit-testing
+    HIT_GRID_CELL = 64
+    # extra slack around images for ease of click, in canvas pixels
+    CLICK_BUFFER = 8
+    # delay before rendering after Prev/Next, so rapid flips render only the last page
+    RENDER_DEBOUNCE_MS = 30
+
     def __init__(self, root: tk.Tk):
         self.root = root
         self.root.title("PDF Editor — Refactor")
@@ -146,20 +266,55 @@ class PDFEditorApp:
         # UI images must be kept referenced to avoid GC
         self._canvas_images = []
 
+        # rendered base pages, keyed by (page_idx, zoom), least recently used first
+        self._page_cache: "OrderedDict[Tuple[int, float], tk.PhotoImage]" = OrderedDict()
+
+        # neighbouring pages rasterized in the background: (page_idx, zoom) -> pixmap.
+        # PhotoImages can only be built on the Tk thread, so the worker hands over pixmaps.
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=1)
+        self._prefetched: Dict[Tuple[int, float], fitz.Pixmap] = {}
+        self._prefetch_lock = threading.Lock()
+        # PyMuPDF documents are not thread-safe; hold this around any self.doc access
+        self._doc_lock = threading.Lock()
+
+        # replacement previews already decoded and resized, keyed by (path, w, h)
+        self._resized_cache: Dict[Tuple[str, int, int], ImageTk.PhotoImage] = {}
+        # replacement images are decoded off the Tk thread; in-flight jobs by the same key
+        self._img_pool = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+        self._decode_futures: Dict[Tuple[str, int, int], Future] = {}
+
+        # image bboxes per page, and a coarse grid over them keyed by (page_idx, zoom):
+        # (gx, gy) -> entries overlapping that cell
+        self._image_info_cache: Dict[int, List[fitz.Rect]] = {}
+        self._hit_grid: Dict[Tuple[int, float], Dict[Tuple[int, int], List[HitEntry]]] = {}
+
+        # extracted words per page, reused across draw-to-read selections
+        self._words_cache: Dict[int, list] = {}
+
         # edit tracking
-        self.modifications: List[ImageModification] = []
+        self.modifications: Dict[ModKey, ImageModification] = {}
 
         # selection state
         self.selected_rect_pdf: Optional[fitz.Rect] = None
         self.selected_rect_canvas: Optional[Tuple[int, int, int, int]] = None
         self.selected_highlight_id: Optional[int] = None
 
+        # pending debounced render (Tk after() id)
+        self._render_after_id: Optional[str] = None
+        # bumped on every render so late async overlays don't land on a newer page
+        self._render_gen = 0
+
+        # persistent canvas items, updated in place between renders: the base page
+        # image, and one overlay per modification (same key) -> (item id, image)
+        self._base_item_id: Optional[int] = None
+        self._overlay_ids: Dict[ModKey, Tuple[int, Optional[ImageTk.PhotoImage]]] = {}
+
         # drawing (read) state
         self.draw_start: Optional[Tuple[float, float]] = None
         self.draw_rect_id: Optional[int] = None
 
         # TTS
-        self.tts_queue = queue.Queue()
+        self.tts_queue = queue.PriorityQueue()
         self.tts_stop_event = threading.Event()
         self.tts_worker: Optional[TTSWorker] = None
         self.tts_ready = False
@@ -167,6 +322,8 @@ class PDFEditorApp:
         # Theme
         self.themes = self._default_themes()
         self.theme = "light"
+        # per-widget configure() options, resolved once per theme
+        self._theme_options = {name: self._theme_widget_options(t) for name, t in self.themes.items()}
 
         # Build UI
         self._build_ui()
@@ -201,6 +358,16 @@ class PDFEditorApp:
             }
         }
 
+    @staticmethod
+    def _theme_widget_options(t: dict) -> dict:
+        label = {"bg": t["bg"], "fg": t["fg"]}
+        return {
+            "root": {"bg": t["bg"]},
+            "canvas": {"bg": t["canvas_bg"]},
+            "status_label": label,
+            "page_label": label,
+        }
+
     def _build_ui(self):
         top = tk.Frame(self.root)
         top.pack(side="top", fill="x", padx=8, pady=6)
@@ -248,14 +415,15 @@ class PDFEditorApp:
         self._bind_canvas()
 
     def _apply_theme(self):
-        t = self.themes[self.theme]
-        self.root.config(bg=t["bg"]) 
-        self.canvas.config(bg=t["canvas_bg"]) 
-        self.status_label.config(bg=t["bg"], fg=t["fg"]) 
-        self.page_label.config(bg=t["bg"], fg=t["fg"]) 
+        opts = self._theme_options[self.theme]
+        self.root.configure(**opts["root"])
+        self.canvas.configure(**opts["canvas"])
+        self.status_label.configure(**opts["status_label"])
+        self.page_label.configure(**opts["page_label"])
 
     def set_theme(self, name: str):
-        if name in self.themes:
+        # re-applying the active theme would only repeat the same Tcl calls
+        if name in self.themes and name != self.theme:
             self.theme = name
             self._apply_theme()
 
@@ -282,12 +450,16 @@ class PDFEditorApp:
         if not path:
             return
         try:
-            if self.doc:
-                self.doc.close()
-            self.doc = fitz.open(path)
+            with self._doc_lock:
+                if self.doc:
+                    self.doc.close()
+                self.doc = fitz.open(path)
             self.doc_path = path
             self.current_page_idx = 0
             self.modifications.clear()
+            self._invalidate_page_cache()
+            self._resized_cache.clear()
+            self._reset_canvas()
             self._render_page()
             self._set_status(f"Opened: {os.path.basename(path)}")
         except Exception as e:
@@ -295,48 +467,244 @@ class PDFEditorApp:
             self._set_status("Failed to open PDF")
 
     def _render_page(self):
-        self.canvas.delete("all")
+        # an explicit render supersedes any pending debounced one
+        if self._render_after_id:
+            self.root.after_cancel(self._render_after_id)
+            self._render_after_id = None
+        self._render_gen += 1
         self._canvas_images.clear()
         if not self.doc:
+            self._reset_canvas()
             self.page_label.config(text="Page: 0/0")
             return
 
         if not (0 <= self.current_page_idx < len(self.doc)):
+            self._reset_canvas()
             self._set_status("Invalid page index")
             return
 
-        page = self.doc[self.current_page_idx]
-        mat = fitz.Matrix(self.zoom, self.zoom)
-        pix = page.get_pixmap(matrix=mat)
-        img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
-
-        tk_img = ImageTk.PhotoImage(img)
+        tk_img = self._get_page_image(self.current_page_idx)
         self._canvas_images.append(tk_img)
-        self.canvas.config(width=img.width, height=img.height)
-        self.canvas.create_image(0, 0, image=tk_img, anchor="nw")
-        self.canvas.config(scrollregion=self.canvas.bbox("all"))
+        width, height = tk_img.width(), tk_img.height()
+        self.canvas.config(width=width, height=height, scrollregion=(0, 0, width, height))
+        if self._base_item_id is None:
+            self._base_item_id = self.canvas.create_image(0, 0, image=tk_img, anchor="nw")
+        else:
+            self.canvas.itemconfigure(self._base_item_id, image=tk_img)
 
-        # re-draw any replacements applied in memory
-        for mod in self.modifications:
-            if mod.page_num != self.current_page_idx:
+        # re-draw any replacements applied in memory, touching only overlays that changed
+        wanted = set()
+        for okey, mod in self.modifications.items():
+            if okey[0] != self.current_page_idx:
                 continue
-            # convert PDF rect to canvas coords
-            x0 = int(mod.old_rect.x0 * self.zoom)
-            y0 = int(mod.old_rect.y0 * self.zoom)
-            x1 = int(mod.old_rect.x1 * self.zoom)
-            y1 = int(mod.old_rect.y1 * self.zoom)
+            wanted.add(okey)
+            # convert PDF rect to canvas coords, once per zoom level
+            if mod.canvas_zoom != self.zoom:
+                mod.canvas_rect = self._to_canvas(mod.old_rect)
+                mod.canvas_zoom = self.zoom
+            x0, y0, x1, y1 = mod.canvas_rect
+            key = (mod.new_image_path, x1 - x0, y1 - y0)
+            new_tk = self._resized_cache.get(key)
+            if new_tk is not None:
+                self._draw_replacement(okey, new_tk, (x0, y0, x1, y1))
+            else:
+                # keep whatever is there alive until the decoded overlay is swapped in
+                existing = self._overlay_ids.get(okey)
+                if existing and existing[1] is not None:
+                    self._canvas_images.append(existing[1])
+                self._request_replacement(okey, key, (x0, y0, x1, y1))
+        for okey in [k for k in self._overlay_ids if k not in wanted]:
+            self.canvas.delete(self._overlay_ids.pop(okey)[0])
+
+        self.page_label.config(text=f"Page: {self.current_page_idx + 1}/{len(self.doc)}")
+        self._set_status(f"Displayed page {self.current_page_idx + 1}")
+        # build the hit-test index now so it's ready before the user clicks
+        self._get_hit_grid(self.current_page_idx)
+        self._schedule_prefetch()
+
+    def _get_page_image(self, page_idx: int) -> tk.PhotoImage:
+        """Return the rendered base page, rasterizing it only on a cache miss."""
+        key = (page_idx, self.zoom)
+        tk_img = self._page_cache.get(key)
+        if tk_img is not None:
+            self._page_cache.move_to_end(key)
+            return tk_img
+
+        pix = self._get_pixmap(page_idx)
+        # Tk reads PPM (P6 header + raw RGB samples) natively
+        ppm = pix.tobytes("ppm")
+
+        # when the cache is full, reload the evicted photo if it has the same
+        # geometry rather than allocating a new Tk photo image
+        tk_img = None
+        if len(self._page_cache) >= self.PAGE_CACHE_SIZE:
+            _, oldest = self._page_cache.popitem(last=False)
+            if (oldest.width(), oldest.height()) == (pix.width, pix.height):
+                oldest.configure(data=ppm, format="PPM")
+                tk_img = oldest
+        if tk_img is None:
+            tk_img = tk.PhotoImage(master=self.root, data=ppm, format="PPM")
+
+        self._page_cache[key] = tk_img
+        return tk_img
+
+    def _get_pixmap(self, page_idx: int) -> fitz.Pixmap:
+        """Rasterize page_idx at the display zoom, taking a prefetched pixmap if there is one."""
+        key = (page_idx, self.zoom)
+        with self._prefetch_lock:
+            pix = self._prefetched.pop(key, None)
+        if pix is None:
+            with self._doc_lock:
+                # the worker may have been rendering this very page while we
+                # waited for the lock; use its result instead of redoing it
+                with self._prefetch_lock:
+                    pix = self._prefetched.pop(key, None)
+                if pix is None:
+                    pix = self._rasterize(self.doc, page_idx, self.zoom)
+        return pix
+
+    def _reset_canvas(self):
+        """Drop every canvas item; the next render recreates them."""
+        self.canvas.delete("all")
+        self._base_item_id = None
+        self._overlay_ids.clear()
+        # the highlight was deleted along with everything else
+        self.selected_highlight_id = None
+
+    def _draw_replacement(self, okey: ModKey, tk_img: Optional[ImageTk.PhotoImage], box: Tuple[int, int, int, int]):
+        """Create or update the overlay for okey; a None image draws a white placeholder box."""
+        x0, y0, x1, y1 = box
+        existing = self._overlay_ids.get(okey)
+        kind = "image" if tk_img is not None else "rectangle"
+        if existing and tk_img is not None and existing[1] is tk_img:
+            # unchanged overlay: nothing to send to Tk
+            item_id = existing[0]
+        elif existing and self.canvas.type(existing[0]) == kind:
+            item_id = existing[0]
+            if tk_img is not None:
+                self.canvas.coords(item_id, x0, y0)
+                self.canvas.itemconfigure(item_id, image=tk_img)
+            else:
+                self.canvas.coords(item_id, x0, y0, x1, y1)
+        else:
+            if existing:
+                self.canvas.delete(existing[0])
+            if tk_img is not None:
+                item_id = self.canvas.create_image(x0, y0, image=tk_img, anchor="nw")
+            else:
+                item_id = self.canvas.create_rectangle(x0, y0, x1, y1, fill="white")
+        self._overlay_ids[okey] = (item_id, tk_img)
+        if tk_img is not None:
+            self._canvas_images.append(tk_img)
+        if self.selected_highlight_id:
+            self.canvas.tag_raise(self.selected_highlight_id)
+
+    def _request_replacement(self, okey: ModKey, key: Tuple[str, int, int], box: Tuple[int, int, int, int]):
+        fut = self._decode_futures.get(key)
+        if fut is None:
+            fut = self._img_pool.submit(_decode_resize, *key)
+            self._decode_futures[key] = fut
+        self.root.after(10, self._poll_decode, fut, okey, key, box, self._render_gen)
+
+    def _poll_decode(self, fut: Future, okey: ModKey, key: Tuple[str, int, int], box: Tuple[int, int, int, int], gen: int):
+        if not fut.done():
+            self.root.after(10, self._poll_decode, fut, okey, key, box, gen)
+            return
+        if self._decode_futures.get(key) is fut:
+            del self._decode_futures[key]
+
+        tk_img = self._resized_cache.get(key)
+        if tk_img is None:
             try:
-                new_pil = Image.open(mod.new_image_path)
-                new_pil = new_pil.resize((x1 - x0, y1 - y0), Image.LANCZOS)
-                new_tk = ImageTk.PhotoImage(new_pil)
-                self._canvas_images.append(new_tk)
-                self.canvas.create_image(x0, y0, image=new_tk, anchor="nw")
+                mode, data = fut.result()
+                _, width, height = key
+                tk_img = ImageTk.PhotoImage(Image.frombytes(mode, (width, height), data), master=self.root)
+                self._resized_cache[key] = tk_img
             except Exception as e:
                 print("Could not render replacement image:", e)
-                self.canvas.create_rectangle(x0, y0, x1, y1, fill="white")
+                if gen == self._render_gen:
+                    self._draw_replacement(okey, None, box)
+                return
+        # the page may have been re-rendered (or changed) while decoding
+        if gen == self._render_gen:
+            self._draw_replacement(okey, tk_img, box)
+
+    @staticmethod
+    def _rasterize(doc: fitz.Document, page_idx: int, zoom: float) -> fitz.Pixmap:
+        """Render a page to an RGB pixmap. Caller must hold _doc_lock."""
+        mat = fitz.Matrix(zoom, zoom)
+        # explicit 3-byte RGB: no alpha plane to push through the PPM -> Tk path
+        return doc.load_page(page_idx).get_pixmap(matrix=mat, alpha=False, colorspace=fitz.csRGB)
+
+    def _schedule_prefetch(self):
+        """Queue background rendering of the pages either side of the current one."""
+        for idx in (self.current_page_idx - 1, self.current_page_idx + 1):
+            if not (0 <= idx < len(self.doc)):
+                continue
+            key = (idx, self.zoom)
+            if key in self._page_cache:
+                continue
+            with self._prefetch_lock:
+                if key in self._prefetched:
+                    continue
+            self._prefetch_pool.submit(self._prefetch_page, self.doc, *key)
 
-        self.page_label.config(text=f"Page: {self.current_page_idx + 1}/{len(self.doc)}")
-        self._set_status(f"Displayed page {self.current_page_idx + 1}")
+    def _prefetch_page(self, doc: fitz.Document, page_idx: int, zoom: float):
+        # runs on the prefetch worker thread
+        key = (page_idx, zoom)
+        try:
+            with self._doc_lock:
+                # the document may have been closed or swapped since this was queued
+                if doc is not self.doc or doc.is_closed:
+                    return
+                pix = self._rasterize(doc, page_idx, zoom)
+                # stored while still holding _doc_lock, so a document swap can't
+                # slip in between and leave a stale page behind its invalidation
+                with self._prefetch_lock:
+                    self._prefetched[key] = pix
+                    # pages the user never turned to shouldn't pile up
+                    while len(self._prefetched) > 1 and sum(p.size for p in self._prefetched.values()) > self.PREFETCH_CACHE_BYTES:
+                        self._prefetched.pop(next(iter(self._prefetched)))
+        except Exception as e:
+            print("Prefetch error:", e)
+
+    def _invalidate_page_cache(self):
+        self._page_cache.clear()
+        with self._prefetch_lock:
+            self._prefetched.clear()
+        self._image_info_cache.clear()
+        self._hit_grid.clear()
+        self._words_cache.clear()
+
+    def _get_image_rects(self, page_idx: int) -> List[fitz.Rect]:
+        rects = self._image_info_cache.get(page_idx)
+        if rects is None:
+            with self._doc_lock:
+                images = self.doc[page_idx].get_image_info()
+            rects = [fitz.Rect(info["bbox"]) for info in images if info.get("bbox")]
+            self._image_info_cache[page_idx] = rects
+        return rects
+
+    def _to_canvas(self, rect: fitz.Rect) -> Tuple[int, int, int, int]:
+        return (int(rect.x0 * self.zoom), int(rect.y0 * self.zoom),
+                int(rect.x1 * self.zoom), int(rect.y1 * self.zoom))
+
+    def _get_hit_grid(self, page_idx: int) -> Dict[Tuple[int, int], List[HitEntry]]:
+        """Bucket the page's image bboxes (plus click buffer) into grid cells."""
+        key = (page_idx, self.zoom)
+        grid = self._hit_grid.get(key)
+        if grid is None:
+            grid = {}
+            cell = self.HIT_GRID_CELL
+            buffer_pdf = self.CLICK_BUFFER / self.zoom
+            for rect in self._get_image_rects(page_idx):
+                rect_buffered = fitz.Rect(rect.x0 - buffer_pdf, rect.y0 - buffer_pdf, rect.x1 + buffer_pdf, rect.y1 + buffer_pdf)
+                entry = (rect, rect_buffered, self._to_canvas(rect))
+                for gx in range(int(rect_buffered.x0 // cell), int(rect_buffered.x1 // cell) + 1):
+                    for gy in range(int(rect_buffered.y0 // cell), int(rect_buffered.y1 // cell) + 1):
+                        grid.setdefault((gx, gy), []).append(entry)
+            self._hit_grid[key] = grid
+        return grid
 
     def prev_page(self):
         if not self.doc:
@@ -344,7 +712,7 @@ class PDFEditorApp:
         if self.current_page_idx > 0:
             self.current_page_idx -= 1
             self._clear_selection()
-            self._render_page()
+            self._schedule_render()
 
     def next_page(self):
         if not self.doc:
@@ -352,7 +720,18 @@ class PDFEditorApp:
         if self.current_page_idx < len(self.doc) - 1:
             self.current_page_idx += 1
             self._clear_selection()
-            self._render_page()
+            self._schedule_render()
+
+    def _schedule_render(self):
+        if self._render_after_id:
+            self.root.after_cancel(self._render_after_id)
+        # keep the page counter responsive while the render is deferred
+        self.page_label.config(text=f"Page: {self.current_page_idx + 1}/{len(self.doc)}")
+        self._render_after_id = self.root.after(self.RENDER_DEBOUNCE_MS, self._do_render)
+
+    def _do_render(self):
+        self._render_after_id = None
+        self._render_page()
 
     def _set_status(self, text: str):
         self.status_label.config(text=f"Status: {text}")
@@ -373,28 +752,18 @@ class PDFEditorApp:
         pdf_x = cx / self.zoom
         pdf_y = cy / self.zoom
 
-        page = self.doc[self.current_page_idx]
-        images = page.get_image_info()
-        if not images:
+        if not self._get_image_rects(self.current_page_idx):
             self._set_status("No images detected on this page")
             return
 
-        # small buffer for ease of click
-        buffer_pdf = 8 / self.zoom
-
-        for info in images:
-            bbox = info.get("bbox")
-            if not bbox:
-                continue
-            rect = fitz.Rect(bbox)
-            rect_buffered = fitz.Rect(rect.x0 - buffer_pdf, rect.y0 - buffer_pdf, rect.x1 + buffer_pdf, rect.y1 + buffer_pdf)
+        # bboxes in the grid are already grown by a small buffer for ease of click
+        cell = self.HIT_GRID_CELL
+        candidates = self._get_hit_grid(self.current_page_idx).get((int(pdf_x // cell), int(pdf_y // cell)), [])
+        for rect, rect_buffered, canvas_rect in candidates:
             if rect_buffered.contains((pdf_x, pdf_y)):
                 self.selected_rect_pdf = rect
-                x0 = int(rect.x0 * self.zoom)
-                y0 = int(rect.y0 * self.zoom)
-                x1 = int(rect.x1 * self.zoom)
-                y1 = int(rect.y1 * self.zoom)
-                self.selected_rect_canvas = (x0, y0, x1, y1)
+                x0, y0, x1, y1 = canvas_rect
+                self.selected_rect_canvas = canvas_rect
                 self.selected_highlight_id = self.canvas.create_rectangle(x0, y0, x1, y1, outline="blue", width=3)
                 self._set_status(f"Selected image at {rect}")
                 return
@@ -415,23 +784,17 @@ class PDFEditorApp:
             return
 
         mod = ImageModification(self.current_page_idx, self.selected_rect_pdf, path)
-        # replace if same rect & page
-        replaced = False
-        for i, existing in enumerate(self.modifications):
-            if existing.page_num == mod.page_num and existing.old_rect == mod.old_rect:
-                self.modifications[i] = mod
-                replaced = True
-                break
-        if not replaced:
-            self.modifications.append(mod)
+        # replaces any existing edit for the same rect & page
+        self.modifications[_mod_key(mod)] = mod
 
         self._set_status(f"Scheduled replacement: {os.path.basename(path)}")
         self._render_page()
 
     def clear_page_edits(self):
         before = len(self.modifications)
-        self.modifications = [m for m in self.modifications if m.page_num != self.current_page_idx]
+        self.modifications = {k: m for k, m in self.modifications.items() if k[0] != self.current_page_idx}
         after = len(self.modifications)
+        self._resized_cache.clear()
         self._set_status(f"Cleared {before - after} edits on page {self.current_page_idx + 1}")
         self._render_page()
 
@@ -448,34 +811,103 @@ class PDFEditorApp:
             return
 
         self._set_status("Saving PDF...")
+        edited = False
+        tmp_path = None
         try:
-            # work on a copy to avoid modifying original in memory
-            new_doc = fitz.open(self.doc_path)
-            for mod in self.modifications:
-                if not (0 <= mod.page_num < len(new_doc)):
-                    continue
-                p = new_doc[mod.page_num]
-                # white-out old area
-                p.draw_rect(mod.old_rect, color=(1, 1, 1), fill=(1, 1, 1))
-                # insert new image
-                p.insert_image(mod.old_rect, filename=mod.new_image_path)
-
-            new_doc.save(out_path)
-            new_doc.close()
-            messagebox.showinfo("Saved", f"Modified PDF saved to:\n{out_path}")
-            self._set_status(f"Saved to {os.path.basename(out_path)}")
-            # reopen saved doc
-            if self.doc:
-                self.doc.close()
-            self.doc = fitz.open(out_path)
+            # edit the already-parsed document in place rather than re-reading it
+            # from disk; it is replaced by the saved file below (or reverted on error)
+            with self._doc_lock:
+                doc = self.doc
+                # group edits so each page is loaded once
+                by_page = defaultdict(list)
+                for mod in self.modifications.values():
+                    by_page[mod.page_num].append((mod.old_rect, mod.new_image_path))
+                # image xref per source file, so a repeated image is embedded once
+                image_xrefs = {}
+                for pnum, ops in by_page.items():
+                    if not (0 <= pnum < len(doc)):
+                        continue
+                    p = doc[pnum]
+                    edited = True
+                    for rect, path in ops:
+                        # white-out old area
+                        p.draw_rect(rect, color=(1, 1, 1), fill=(1, 1, 1))
+                        # insert new image
+                        if path in image_xrefs:
+                            p.insert_image(rect, xref=image_xrefs[path])
+                        else:
+                            image_xrefs[path] = p.insert_image(rect, filename=path)
+
+                # samefile also catches symlinks and case-insensitive paths to the open file;
+                # if the opened file has since been moved or deleted, nothing is overwritten
+                overwrite = (os.path.exists(out_path) and os.path.exists(self.doc_path)
+                             and os.path.samefile(out_path, self.doc_path))
+                full_save = dict(garbage=4, clean=True, deflate=True, deflate_images=True, use_objstms=1)
+                if overwrite and doc.can_save_incrementally():
+                    # append only the changed objects instead of rewriting the whole file
+                    doc.save(out_path, incremental=True, encryption=fitz.PDF_ENCRYPT_KEEP, deflate=True, garbage=0)
+                elif overwrite:
+                    # MuPDF won't fully rewrite the file it has open: write a sibling
+                    # temp file, release the original, then swap it into place
+                    fd, tmp_path = tempfile.mkstemp(suffix=".pdf", dir=os.path.dirname(os.path.abspath(out_path)))
+                    os.close(fd)
+                    doc.save(tmp_path, **full_save)
+                    # mkstemp creates the file 0600; keep the original's permissions
+                    shutil.copymode(out_path, tmp_path)
+                    doc.close()
+                    self.doc = None
+                    os.replace(tmp_path, out_path)
+                    tmp_path = None
+                else:
+                    # full rewrite: compact it once while we're at it
+                    doc.save(out_path, **full_save)
+            # reopen saved doc before any dialog runs a nested event loop
+            with self._doc_lock:
+                if self.doc is not None and not self.doc.is_closed:
+                    self.doc.close()
+                self.doc = fitz.open(out_path)
             self.doc_path = out_path
             self.current_page_idx = 0
             self.modifications.clear()
+            self._invalidate_page_cache()
+            self._resized_cache.clear()
+            # the old selection belongs to the previous document
+            self._clear_selection()
             self._render_page()
+            messagebox.showinfo("Saved", f"Modified PDF saved to:\n{out_path}")
+            self._set_status(f"Saved to {os.path.basename(out_path)}")
         except Exception as e:
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            if edited:
+                self._revert_doc()
             messagebox.showerror("Save Error", f"Could not save PDF: {e}\n{traceback.format_exc()}")
             self._set_status("Save failed")
 
+    def _revert_doc(self):
+        """Discard edits applied to self.doc by a failed save.
+
+        Pending modifications are kept, unless the source file can't be
+        reopened, in which case there is no document left to apply them to.
+        """
+        try:
+            reopened = fitz.open(self.doc_path)
+        except Exception as e:
+            print("Could not reload PDF after failed save:", e)
+            reopened = None
+        with self._doc_lock:
+            # only now that the outcome is known is the edited document released
+            if self.doc is not None and not self.doc.is_closed:
+                self.doc.close()
+            self.doc = reopened
+        self._invalidate_page_cache()
+        self._clear_selection()
+        if reopened is None:
+            # nothing left to show; _render_page resets the canvas and label
+            self.doc_path = None
+            self.modifications.clear()
+        self._render_page()
+
     # ---------------- Draw-to-read (TTS) ----------------
 
     def on_draw_start(self, event):
@@ -518,38 +950,37 @@ class PDFEditorApp:
         if not self.doc:
             return
         try:
-            page = self.doc[self.current_page_idx]
-            txt = page.get_text(clip=rect).strip()
+            txt = self._text_in_rect(self.current_page_idx, rect)
             if not txt:
                 self._set_status("No text found in selection")
                 return
             self._set_status("Queuing text for speech")
-            self.tts_queue.put(txt)
+            for chunk in split_sentences(txt):
+                self.tts_worker.say(chunk)
         except Exception as e:
             print("Read error:", e)
             self._set_status("Could not extract text")
 
+    def _text_in_rect(self, page_idx: int, rect: fitz.Rect) -> str:
+        """Text of the words whose centre lies in rect, one line of output per text line."""
+        words = self._words_cache.get(page_idx)
+        if words is None:
+            # the page's text layer is parsed once; selections only filter it
+            with self._doc_lock:
+                words = self.doc[page_idx].get_text("words")
+            self._words_cache[page_idx] = words
+
+        lines = {}
+        for x0, y0, x1, y1, word, block_no, line_no, _ in words:
+            if rect.contains(((x0 + x1) / 2, (y0 + y1) / 2)):
+                lines.setdefault((block_no, line_no), []).append(word)
+        return "\n".join(" ".join(line) for line in lines.values()).strip()
+
     def stop_speaking(self):
         if not self.tts_ready:
             return
-        # clear existing queue
-        while not self.tts_queue.empty():
-            try:
-                self.tts_queue.get_nowait()
-            except queue.Empty:
-                break
-        # stop engine via worker stop (engine.stop() will be called inside worker cleanup)
-        self.tts_stop_event.set()
-        # restart worker so user can resume TTS later
-        try:
-            if self.tts_worker and self.tts_worker.is_alive():
-                self.tts_worker.join(timeout=0.5)
-        except Exception:
-            pass
-        # create a fresh worker
-        self.tts_stop_event.clear()
-        self.tts_worker = TTSWorker(self.tts_queue, self.tts_stop_event)
-        self.tts_worker.start()
+        # the worker drops its backlog and keeps its engine; no restart needed
+        self.tts_worker.flush()
         self._set_status("Speech stopped")
 
     # ---------------- Helpers ----------------
@@ -569,9 +1000,12 @@ class PDFEditorApp:
                 self.tts_worker.join(timeout=1.0)
         except Exception:
             pass
+        self._prefetch_pool.shutdown(wait=False)
+        self._img_pool.shutdown(wait=False)
         try:
-            if self.doc:
-                self.doc.close()
+            with self._doc_lock:
+                if self.doc:
+                    self.doc.close()
         except Exception:
             pass
         self.root.destroy()